@@ -5,12 +5,45 @@ Continuously monitors a log file for ERROR entries and sends mock email alerts.
 """
 
 import time
-import re
 import os
+import re
+from collections import OrderedDict
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Not on Linux or inotify_simple not installed - poll instead
+    INotify = None
+
+ERROR_NEEDLE = b'error'
+POLL_INTERVAL = 0.1  # seconds, only used without inotify
+ALERT_DEDUP_WINDOW = 300  # seconds to suppress repeat emails for the same error
+MAX_TRACKED_ALERTS = 10000
+# Leading 'YYYY-MM-DD HH:MM:SS[.fff]' stamp (optionally bracketed), ignored when comparing alerts
+_LEADING_TS_RE = re.compile(rb'\s*\[?\d{4}-\d{2}-\d{2}[ t]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\]?')
 
 def mock_send_email(error_line):
     """Mock email alert function"""
-    print(f"📧 ALERT EMAIL SENT: {error_line.strip()}")
+    print(f"📧 ALERT EMAIL SENT: {error_line}")
+
+def should_alert(line_lower, recent_alerts):
+    """Return False if the same error (ignoring its leading timestamp) was alerted recently"""
+    now = time.monotonic()
+    stamp = _LEADING_TS_RE.match(line_lower)
+    key = hash(line_lower[stamp.end():].strip() if stamp else line_lower.strip())
+    last_sent = recent_alerts.get(key)
+    if last_sent is not None and now - last_sent < ALERT_DEDUP_WINDOW:
+        return False
+    
+    recent_alerts[key] = now
+    recent_alerts.move_to_end(key)  # Keep entries ordered oldest-sent first
+    
+    # Evict from the old end: anything expired, then the oldest while over the cap
+    while recent_alerts:
+        oldest_sent = next(iter(recent_alerts.values()))
+        if len(recent_alerts) <= MAX_TRACKED_ALERTS and now - oldest_sent < ALERT_DEDUP_WINDOW:
+            break
+        recent_alerts.popitem(last=False)
+    return True
 
 def monitor_log(log_file_path="/home/gideon/Desktop/PHASE 3/Assessment_prep/test-log.log"):
     """Monitor log file for ERROR entries in real-time"""
@@ -19,21 +52,37 @@ def monitor_log(log_file_path="/home/gideon/Desktop/PHASE 3/Assessment_prep/test
         os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         open(log_file_path, 'a').close()
     
-    with open(log_file_path, 'r') as file:
+    # Let the kernel wake us on writes instead of polling the file
+    inotify = None
+    if INotify is not None:
+        inotify = INotify()
+        inotify.add_watch(log_file_path, flags.MODIFY)
+    
+    with open(log_file_path, 'rb') as file:
         # Move to end of file
         file.seek(0, 2)
         
         print(f"🔍 Monitoring {log_file_path} for ERROR entries...")
+        recent_alerts = OrderedDict()  # error key hash -> monotonic time of last email, oldest first
         
-        while True:
-            line = file.readline()
-            if line:
-                # Case-insensitive ERROR detection
-                if re.search(r'error', line, re.IGNORECASE):
-                    print(f"❌ ERROR DETECTED: {line.strip()}")
-                    mock_send_email(line)
-            else:
-                time.sleep(0.1)  # Brief pause when no new lines
+        try:
+            while True:
+                line = file.readline()
+                if line:
+                    # Case-insensitive ERROR detection (plain substring, no regex)
+                    line_lower = line.lower()
+                    if ERROR_NEEDLE in line_lower:
+                        text = line.decode('utf-8', errors='replace').strip()
+                        print(f"❌ ERROR DETECTED: {text}")
+                        if should_alert(line_lower, recent_alerts):
+                            mock_send_email(text)
+                elif inotify is not None:
+                    inotify.read()  # Block until the file is modified
+                else:
+                    time.sleep(POLL_INTERVAL)  # Brief pause when no new lines
+        finally:
+            if inotify is not None:
+                inotify.close()
 
 if __name__ == "__main__":
     try:
@@ -4,56 +4,128 @@ Log Parsing and Sorting
 Reads log file, filters ERROR entries, groups by error type, and generates frequency report.
 """
 
+import mmap
+import os
 import re
-from collections import Counter
+import stat
+import time
+from collections import Counter, deque
 from datetime import datetime
 
-def parse_log_file(log_file_path):
-    """Parse log file and extract ERROR entries with timestamps"""
-    errors = []
+# Keywords that mark a line for the report. They are compiled into one alternation so
+# adding e.g. b'fatal' or b'critical' keeps the scan to a single pass over the file.
+SIGNAL_KEYWORDS = (b'error',)
+_SIGNAL_RE = re.compile(b'|'.join(re.escape(kw) for kw in SIGNAL_KEYWORDS), re.IGNORECASE)
+# Matching lines are decoded before extraction so \w/\s keep their Unicode meaning
+_SIGNAL_TEXT_RE = re.compile(_SIGNAL_RE.pattern.decode(), re.IGNORECASE)
+_TS_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+# Group 1 is the keyword that matched; a letter suffix ending the word (WARN-ING) is
+# skipped so group 2 is the type word that follows
+_ETYPE_RE = re.compile(r'(' + _SIGNAL_TEXT_RE.pattern + r')(?:[A-Za-z]*(?=[\s:]))?:?\s*(\w+)', re.IGNORECASE)
+SIGNAL_LABEL = '/'.join(kw.decode().upper() for kw in SIGNAL_KEYWORDS)  # e.g. "ERROR/WARN"
+
+READ_BLOCK_SIZE = 4 << 20  # 4MB binary reads when the file can't be mmap'd
+# Only mmap files untouched for this long. Truncating a mapped file (e.g. logrotate
+# copytruncate) makes reads past the new end raise SIGBUS, which kills the process.
+MMAP_MIN_IDLE = 300  # seconds
+
+def extract_error(line):
+    """Extract timestamp, matched keyword level and type from a signal line"""
+    timestamp_match = _TS_RE.search(line)
+    error_type_match = _ETYPE_RE.search(line)
+    if error_type_match:
+        level, error_type = error_type_match.group(1).upper(), error_type_match.group(2)
+    else:
+        level, error_type = _SIGNAL_TEXT_RE.search(line).group().upper(), "Generic"
+    
+    return {
+        'timestamp': timestamp_match.group() if timestamp_match else "Unknown",
+        'level': level,
+        'error_type': error_type,
+        'full_line': line.strip()
+    }
+
+def extract_errors(raw_line):
+    """Decode a raw line found by the bytes scan and extract each signal entry in it"""
+    text = raw_line.decode('utf-8', errors='replace')
+    if '\r' not in text:
+        return [extract_error(text)]
+    # The scan splits on \n only; a bare \r also ends a line, as in text mode
+    return [extract_error(line) for line in text.split('\r') if _SIGNAL_TEXT_RE.search(line)]
+
+def iter_lines(file, block_size=READ_BLOCK_SIZE):
+    """Yield raw lines from a binary file, reading it in large blocks"""
+    carry = b''
+    while True:
+        block = file.read(block_size)
+        if not block:
+            break
+        lines = (carry + block).split(b'\n')
+        carry = lines.pop()  # Last piece may straddle the next block
+        yield from lines
+    if carry:
+        yield carry
+
+def iter_signal_lines(buf):
+    """Yield only the lines of buf containing a signal keyword, jumping between regex matches"""
+    pos = 0
+    while True:
+        match = _SIGNAL_RE.search(buf, pos)
+        if not match:
+            return
+        newline = buf.rfind(b'\n', pos, match.start())
+        line_start = newline + 1 if newline != -1 else pos
+        line_end = buf.find(b'\n', match.end())
+        if line_end == -1:
+            line_end = len(buf)
+        yield buf[line_start:line_end]
+        pos = line_end + 1  # Resume after this line so it is only counted once
+
+def parse_log_file(log_file_path, sample_size=3):
+    """Scan log file in a single pass, counting (level, type) pairs and keeping the last few entries"""
+    error_counts = Counter()
+    recent_errors = deque(maxlen=sample_size)
     
     try:
-        with open(log_file_path, 'r') as file:
-            for line in file:
-                if re.search(r'error', line, re.IGNORECASE):
-                    # Extract timestamp and error type
-                    timestamp_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-                    error_type_match = re.search(r'ERROR:?\s*(\w+)', line, re.IGNORECASE)
-                    
-                    timestamp = timestamp_match.group() if timestamp_match else "Unknown"
-                    error_type = error_type_match.group(1) if error_type_match else "Generic"
-                    
-                    errors.append({
-                        'timestamp': timestamp,
-                        'error_type': error_type,
-                        'full_line': line.strip()
-                    })
+        with open(log_file_path, 'rb') as file:
+            st = os.fstat(file.fileno())
+            idle = time.time() - st.st_mtime >= MMAP_MIN_IDLE
+            if stat.S_ISREG(st.st_mode) and st.st_size > 0 and idle:
+                # Closed/rotated log: map it so the regex scans page-cache memory directly
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    for raw_line in iter_signal_lines(buf):
+                        for error in extract_errors(raw_line):
+                            error_counts[(error['level'], error['error_type'])] += 1
+                            recent_errors.append(error)
+            else:
+                # Live logs, FIFOs, /proc and empty files (size 0, can't be mapped): stream them
+                for raw_line in iter_lines(file):
+                    if _SIGNAL_RE.search(raw_line):
+                        for error in extract_errors(raw_line):
+                            error_counts[(error['level'], error['error_type'])] += 1
+                            recent_errors.append(error)
     except FileNotFoundError:
         print(f"❌ Log file not found: {log_file_path}")
-        return []
     
-    return errors
+    return error_counts, recent_errors
 
-def generate_error_report(errors):
-    """Generate sorted report of most frequent errors"""
-    if not errors:
-        print("No errors found in log file")
+def generate_error_report(error_counts, recent_errors):
+    """Generate sorted report of most frequent entries per keyword level and type"""
+    if not error_counts:
+        print(f"No {SIGNAL_LABEL} entries found in log file")
         return
     
-    # Count error types
-    error_counts = Counter(error['error_type'] for error in errors)
-    
-    print("📊 ERROR FREQUENCY REPORT")
+    print(f"📊 {SIGNAL_LABEL} FREQUENCY REPORT")
     print("=" * 40)
-    print(f"Total errors found: {len(errors)}")
-    print("\nMost frequent errors:")
+    print(f"Total {SIGNAL_LABEL} entries found: {sum(error_counts.values())}")
+    print("\nMost frequent entries:")
     
-    for error_type, count in error_counts.most_common():
-        print(f"  {error_type}: {count} occurrences")
+    for (level, error_type), count in error_counts.most_common():
+        print(f"  {level} {error_type}: {count} occurrences")
     
-    print("\n📝 Recent error samples:")
-    for error in errors[-3:]:  # Show last 3 errors
-        print(f"  [{error['timestamp']}] {error['error_type']}: {error['full_line'][:80]}...")
+    print("\n📝 Recent samples:")
+    for error in recent_errors:
+        print(f"  [{error['timestamp']}] {error['level']} {error['error_type']}: {error['full_line'][:80]}...")
 
 def create_sample_log():
     """Create sample log file for testing"""
@@ -78,5 +150,5 @@ if __name__ == "__main__":
         log_file = "sample.log"
         create_sample_log()
     
-    errors = parse_log_file(log_file)
-    generate_error_report(errors)
\ No newline at end of file
+    error_counts, recent_errors = parse_log_file(log_file)
+    generate_error_report(error_counts, recent_errors)
\ No newline at end of file
@@ -4,10 +4,10 @@ API Status Checker with Alerting
 Periodically checks API endpoints and sends alerts for failures or delays.
 """
 
-import requests
+import asyncio
+import aiohttp
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configuration
 API_ENDPOINTS = [
@@ -19,6 +19,7 @@ API_ENDPOINTS = [
 
 TIMEOUT_THRESHOLD = 5  # seconds
 CHECK_INTERVAL = 30    # seconds
+MAX_CONNECTIONS = 32  # keep-alive pool shared by all checks
 
 def mock_send_alert(endpoint, status_code, response_time, error=None):
     """Mock alert function"""
@@ -28,55 +29,51 @@ def mock_send_alert(endpoint, status_code, response_time, error=None):
     else:
         print(f"🚨 [{timestamp}] ALERT: {endpoint} - Status: {status_code}, Time: {response_time:.2f}s")
 
-def check_endpoint(endpoint):
+async def check_endpoint(session, endpoint):
     """Check single API endpoint"""
     try:
         start_time = time.time()
-        response = requests.get(endpoint, timeout=TIMEOUT_THRESHOLD)
+        timeout = aiohttp.ClientTimeout(total=TIMEOUT_THRESHOLD)
+        async with session.get(endpoint, timeout=timeout) as response:
+            await response.read()
         response_time = time.time() - start_time
         
         result = {
             'endpoint': endpoint,
-            'status_code': response.status_code,
+            'status_code': response.status,
             'response_time': response_time,
-            'success': 200 <= response.status_code < 300 and response_time <= TIMEOUT_THRESHOLD
+            'success': 200 <= response.status < 300 and response_time <= TIMEOUT_THRESHOLD
         }
         
         # Log result
         status_icon = "✅" if result['success'] else "❌"
-        print(f"{status_icon} {endpoint} - {response.status_code} ({response_time:.2f}s)")
+        print(f"{status_icon} {endpoint} - {response.status} ({response_time:.2f}s)")
         
         # Send alert if failed
         if not result['success']:
             if response_time > TIMEOUT_THRESHOLD:
-                mock_send_alert(endpoint, response.status_code, response_time)
-            elif not (200 <= response.status_code < 300):
-                mock_send_alert(endpoint, response.status_code, response_time)
+                mock_send_alert(endpoint, response.status, response_time)
+            elif not (200 <= response.status < 300):
+                mock_send_alert(endpoint, response.status, response_time)
         
         return result
         
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         print(f"⏰ {endpoint} - TIMEOUT")
         mock_send_alert(endpoint, None, TIMEOUT_THRESHOLD, "Request timeout")
         return {'endpoint': endpoint, 'success': False, 'error': 'timeout'}
         
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         print(f"❌ {endpoint} - CONNECTION ERROR: {e}")
         mock_send_alert(endpoint, None, 0, str(e))
         return {'endpoint': endpoint, 'success': False, 'error': str(e)}
 
-def check_all_endpoints():
-    """Check all endpoints concurrently"""
+async def check_all_endpoints(session):
+    """Check all endpoints concurrently on one event loop"""
     print(f"\n🔍 Checking {len(API_ENDPOINTS)} endpoints...")
     
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_endpoint = {executor.submit(check_endpoint, endpoint): endpoint 
-                             for endpoint in API_ENDPOINTS}
-        
-        results = []
-        for future in as_completed(future_to_endpoint):
-            result = future.result()
-            results.append(result)
+    results = await asyncio.gather(*(check_endpoint(session, endpoint)
+                                     for endpoint in API_ENDPOINTS))
     
     # Summary
     successful = sum(1 for r in results if r.get('success', False))
@@ -84,6 +81,15 @@ def check_all_endpoints():
     
     return results
 
+async def run_checks():
+    """Check endpoints forever, reusing one session's connections between rounds"""
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        while True:
+            await check_all_endpoints(session)
+            print(f"⏳ Waiting {CHECK_INTERVAL}s for next check...\n")
+            await asyncio.sleep(CHECK_INTERVAL)
+
 def monitor_apis():
     """Main monitoring loop"""
     print("🚀 Starting API Status Monitor...")
@@ -92,10 +98,7 @@ def monitor_apis():
     print(f"⏰ Timeout threshold: {TIMEOUT_THRESHOLD}s")
     
     try:
-        while True:
-            check_all_endpoints()
-            print(f"⏳ Waiting {CHECK_INTERVAL}s for next check...\n")
-            time.sleep(CHECK_INTERVAL)
+        asyncio.run(run_checks())
     except KeyboardInterrupt:
         print("\n🛑 Monitoring stopped")
 
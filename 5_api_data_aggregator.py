@@ -6,18 +6,76 @@ Fetches data from REST API, parses JSON, and displays aggregated statistics.
 
 import requests
 import json
-from collections import Counter
+from collections import Counter, defaultdict
 
-def fetch_api_data(url):
-    """Fetch data from REST API endpoint"""
+try:
+    import orjson  # SIMD JSON parser, noticeably faster on large payloads
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd  # Vectorised stats for large payloads
+except ImportError:
+    pd = None
+
+CACHE_FILE = "api_cache.json"  # ETag / Last-Modified validators and bodies per URL
+VECTORISE_MIN_ROWS = 5000  # Below this, DataFrame setup costs more than the Python loop
+
+def json_loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def json_dumps(obj):
+    """Serialise object to JSON bytes, using orjson when available"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+def load_cache(cache_file=CACHE_FILE):
+    """Load cached API responses from disk"""
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):  # Missing/unreadable file or corrupt JSON (JSONDecodeError is a ValueError)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache, cache_file=CACHE_FILE):
+    """Persist cached API responses to disk"""
+    try:
+        with open(cache_file, 'wb') as f:
+            f.write(json_dumps(cache))
+    except OSError as e:
+        print(f"⚠️  Could not save API cache: {e}")
+
+def fetch_api_data(url, cache=None):
+    """Fetch data from REST API endpoint, revalidating any cached copy with a conditional GET"""
+    cached = cache.get(url) if cache is not None else None
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
     try:
         print(f"🌐 Fetching data from: {url}")
-        response = requests.get(url, timeout=10)
+        response = requests.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            print("♻️  Not modified, using cached data")
+            return cached['data']
         response.raise_for_status()
-        return response.json()
+        data = json_loads(response.content)
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if cache is not None and (etag or last_modified):
+            cache[url] = {'etag': etag, 'last_modified': last_modified, 'data': data}
+        return data
     except requests.exceptions.RequestException as e:
         print(f"❌ API request failed: {e}")
         return None
+    except json.JSONDecodeError as e:
+        print(f"❌ Invalid JSON response: {e}")
+        return None
 
 def analyze_posts_data(posts):
     """Analyze posts data and generate statistics"""
@@ -28,23 +86,42 @@ def analyze_posts_data(posts):
     print("=" * 40)
     print(f"Total posts: {len(posts)}")
     
-    # User activity analysis
-    user_posts = Counter(post['userId'] for post in posts)
+    if pd is not None and len(posts) >= VECTORISE_MIN_ROWS:
+        # Vectorised: group/count and string lengths computed in C
+        df = pd.DataFrame(posts, columns=['userId', 'title', 'body'])
+        top_users = list(df.groupby('userId', sort=False).size().nlargest(5).items())
+        title_lengths = df['title'].str.len()
+        title_total, title_min, title_max = title_lengths.sum(), title_lengths.min(), title_lengths.max()
+        body_total = df['body'].str.len().sum()
+    else:
+        # Single pass over posts: user activity plus running title/body length stats
+        user_posts = Counter()
+        title_total = body_total = 0
+        title_min = title_max = len(posts[0]['title'])
+        for post in posts:
+            user_posts[post['userId']] += 1
+            title_length = len(post['title'])
+            title_total += title_length
+            if title_length < title_min:
+                title_min = title_length
+            elif title_length > title_max:
+                title_max = title_length
+            body_total += len(post['body'])
+        top_users = user_posts.most_common(5)
+    
     print(f"\n👥 Most active users:")
-    for user_id, count in user_posts.most_common(5):
+    for user_id, count in top_users:
         print(f"  User {user_id}: {count} posts")
     
     # Title length analysis
-    title_lengths = [len(post['title']) for post in posts]
-    avg_title_length = sum(title_lengths) / len(title_lengths)
+    avg_title_length = title_total / len(posts)
     print(f"\n📝 Title statistics:")
     print(f"  Average title length: {avg_title_length:.1f} characters")
-    print(f"  Shortest title: {min(title_lengths)} characters")
-    print(f"  Longest title: {max(title_lengths)} characters")
+    print(f"  Shortest title: {title_min} characters")
+    print(f"  Longest title: {title_max} characters")
     
     # Body length analysis
-    body_lengths = [len(post['body']) for post in posts]
-    avg_body_length = sum(body_lengths) / len(body_lengths)
+    avg_body_length = body_total / len(posts)
     print(f"\n📄 Body statistics:")
     print(f"  Average body length: {avg_body_length:.1f} characters")
 
@@ -58,10 +135,16 @@ def analyze_users_data(users):
     print(f"Total users: {len(users)}")
     
     # Domain analysis
-    domains = [user['email'].split('@')[1] for user in users if '@' in user['email']]
-    domain_counts = Counter(domains)
+    if pd is not None and len(users) >= VECTORISE_MIN_ROWS:
+        emails = pd.Series([user['email'] for user in users])
+        domains = emails[emails.str.contains('@', regex=False)].str.split('@').str[1]
+        # Stable descending sort keeps first-seen order for ties, like Counter.most_common()
+        domain_counts = domains.value_counts(sort=False).sort_values(ascending=False, kind='stable').items()
+    else:
+        domains = [user['email'].split('@')[1] for user in users if '@' in user['email']]
+        domain_counts = Counter(domains).most_common()
     print(f"\n📧 Email domains:")
-    for domain, count in domain_counts.most_common():
+    for domain, count in domain_counts:
         print(f"  {domain}: {count} users")
     
     # Company analysis
@@ -80,28 +163,35 @@ def analyze_todos_data(todos):
     print("=" * 40)
     print(f"Total todos: {len(todos)}")
     
-    # Completion analysis
-    completed = sum(1 for todo in todos if todo['completed'])
+    if pd is not None and len(todos) >= VECTORISE_MIN_ROWS:
+        # Vectorised: per-user total/completed via one groupby aggregation
+        df = pd.DataFrame(todos, columns=['userId', 'completed'])
+        completed = int(df['completed'].sum())
+        per_user = df.groupby('userId', sort=False)['completed'].agg(total='size', done='sum')
+        per_user = per_user.sort_values('done', ascending=False, kind='stable')
+        top_users = list(per_user.head(5).itertuples(name=None))
+    else:
+        # Single pass over todos: overall completion plus per-user [total, completed]
+        completed = 0
+        user_todos = defaultdict(lambda: [0, 0])
+        for todo in todos:
+            stats = user_todos[todo['userId']]
+            stats[0] += 1
+            if todo['completed']:
+                stats[1] += 1
+                completed += 1
+        sorted_users = sorted(user_todos.items(), 
+                             key=lambda x: x[1][1], reverse=True)
+        top_users = [(user_id, total, done) for user_id, (total, done) in sorted_users[:5]]
+    
     completion_rate = (completed / len(todos)) * 100
     print(f"Completed: {completed} ({completion_rate:.1f}%)")
     print(f"Pending: {len(todos) - completed} ({100 - completion_rate:.1f}%)")
     
-    # User productivity
-    user_todos = {}
-    for todo in todos:
-        user_id = todo['userId']
-        if user_id not in user_todos:
-            user_todos[user_id] = {'total': 0, 'completed': 0}
-        user_todos[user_id]['total'] += 1
-        if todo['completed']:
-            user_todos[user_id]['completed'] += 1
-    
     print(f"\n📈 Top productive users:")
-    sorted_users = sorted(user_todos.items(), 
-                         key=lambda x: x[1]['completed'], reverse=True)
-    for user_id, stats in sorted_users[:5]:
-        completion_rate = (stats['completed'] / stats['total']) * 100
-        print(f"  User {user_id}: {stats['completed']}/{stats['total']} ({completion_rate:.1f}%)")
+    for user_id, total, done in top_users:
+        completion_rate = (done / total) * 100
+        print(f"  User {user_id}: {done}/{total} ({completion_rate:.1f}%)")
 
 def main():
     """Main function to demonstrate API data aggregation"""
@@ -118,9 +208,10 @@ def main():
         print(f"  {key}: {url}")
     
     choice = input("\nSelect endpoint (posts/users/todos) or press Enter for all: ").strip().lower()
+    cache = load_cache()
     
     if choice and choice in endpoints:
-        data = fetch_api_data(endpoints[choice])
+        data = fetch_api_data(endpoints[choice], cache)
         if data:
             if choice == 'posts':
                 analyze_posts_data(data)
@@ -131,7 +222,7 @@ def main():
     else:
         # Analyze all endpoints
         for endpoint_name, url in endpoints.items():
-            data = fetch_api_data(url)
+            data = fetch_api_data(url, cache)
             if data:
                 if endpoint_name == 'posts':
                     analyze_posts_data(data)
@@ -139,6 +230,8 @@ def main():
                     analyze_users_data(data)
                 elif endpoint_name == 'todos':
                     analyze_todos_data(data)
+    
+    save_cache(cache)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,50 +5,60 @@ Reads local log files and uploads them to API endpoint with retry logic.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import time
 import os
+import zlib
 from pathlib import Path
 
 # Configuration
 API_ENDPOINT = "https://httpbin.org/post"  # Mock API for testing
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
-CHUNK_SIZE = 1024 * 1024  # 1MB chunks for large files
+READ_SIZE = 64 * 1024  # bytes read per compression step
+COMPRESSION_LEVEL = 6
 
-def read_log_file(file_path):
-    """Read log file content"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        print(f"❌ Error reading {file_path}: {e}")
-        return None
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
 
-def upload_log_with_retry(file_path, content, api_endpoint=API_ENDPOINT):
-    """Upload log content to API with retry logic"""
-    payload = {
-        'filename': os.path.basename(file_path),
-        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-        'size': len(content),
-        'content': content
-    }
-    
+def gzip_stream(file_obj, read_size=READ_SIZE):
+    """Yield gzip-compressed chunks of a binary file as it is read"""
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    while True:
+        block = file_obj.read(read_size)
+        if not block:
+            break
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def upload_log_with_retry(file_path, api_endpoint=API_ENDPOINT):
+    """Stream log file to API with retry logic"""
     headers = {
-        'Content-Type': 'application/json',
-        'User-Agent': 'LogUploader/1.0'
+        'Content-Type': 'application/octet-stream',
+        'Content-Encoding': 'gzip',
+        'User-Agent': 'LogUploader/1.0',
+        'X-Filename': os.path.basename(file_path),
+        'X-Timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
     }
     
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             print(f"📤 Uploading {file_path} (attempt {attempt}/{MAX_RETRIES})...")
             
-            response = requests.post(
-                api_endpoint,
-                json=payload,
-                headers=headers,
-                timeout=30
-            )
+            # Compress while streaming so neither the raw nor the gzipped file is held in memory
+            with open(file_path, 'rb') as f:
+                headers['X-Size'] = str(os.fstat(f.fileno()).st_size)
+                response = _SESSION.post(
+                    api_endpoint,
+                    data=gzip_stream(f),
+                    headers=headers,
+                    timeout=30
+                )
             
             if response.status_code == 200:
                 print(f"✅ Successfully uploaded {file_path}")
@@ -62,6 +72,9 @@ def upload_log_with_retry(file_path, content, api_endpoint=API_ENDPOINT):
             print(f"🔌 Connection error for {file_path} (attempt {attempt})")
         except requests.exceptions.RequestException as e:
             print(f"❌ Request error for {file_path}: {e}")
+        except OSError as e:
+            print(f"❌ Error reading {file_path}: {e}")
+            return False
         
         if attempt < MAX_RETRIES:
             print(f"⏳ Retrying in {RETRY_DELAY} seconds...")
@@ -70,42 +83,6 @@ def upload_log_with_retry(file_path, content, api_endpoint=API_ENDPOINT):
     print(f"❌ Failed to upload {file_path} after {MAX_RETRIES} attempts")
     return False
 
-def upload_large_file_chunks(file_path, api_endpoint=API_ENDPOINT):
-    """Upload large files in chunks"""
-    file_size = os.path.getsize(file_path)
-    
-    if file_size <= CHUNK_SIZE:
-        # Small file, upload normally
-        content = read_log_file(file_path)
-        if content is not None:
-            return upload_log_with_retry(file_path, content, api_endpoint)
-        return False
-    
-    # Large file, upload in chunks
-    print(f"📦 Large file detected ({file_size} bytes), uploading in chunks...")
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            chunk_num = 0
-            while True:
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
-                    break
-                
-                chunk_num += 1
-                chunk_filename = f"{os.path.basename(file_path)}.chunk{chunk_num}"
-                
-                success = upload_log_with_retry(chunk_filename, chunk, api_endpoint)
-                if not success:
-                    return False
-        
-        print(f"✅ Successfully uploaded {file_path} in {chunk_num} chunks")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error processing large file {file_path}: {e}")
-        return False
-
 def find_log_files(directory):
     """Find all log files in directory"""
     log_files = []
@@ -159,7 +136,7 @@ def main():
     # Upload each file
     successful_uploads = 0
     for log_file in log_files:
-        if upload_large_file_chunks(log_file, api_url):
+        if upload_log_with_retry(log_file, api_url):
             successful_uploads += 1
     
     print(f"\n📊 Upload Summary:")
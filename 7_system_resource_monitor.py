@@ -23,7 +23,7 @@ def mock_send_email(subject, message):
 
 def get_system_usage():
     """Get current CPU and memory usage"""
-    cpu_percent = psutil.cpu_percent(interval=1)
+    cpu_percent = psutil.cpu_percent(interval=None)  # Non-blocking: usage since last call
     memory = psutil.virtual_memory()
     memory_percent = memory.percent
     
@@ -54,10 +54,14 @@ def monitor_system():
     print(f"⚠️  Memory Threshold: {MEMORY_THRESHOLD}%")
     print(f"⏱️  Check Interval: {CHECK_INTERVAL}s")
     
+    # Prime psutil's reference sample, then wait a full interval so the first
+    # non-blocking reading covers CHECK_INTERVAL seconds rather than a few ms
+    psutil.cpu_percent(interval=None)
+    
     try:
         while True:
-            check_and_alert()
             time.sleep(CHECK_INTERVAL)
+            check_and_alert()
     except KeyboardInterrupt:
         print("\n🛑 Monitoring stopped")
 
@@ -8,6 +8,9 @@ import os
 import subprocess
 from datetime import datetime
 
+CRON_D_DIR = "/etc/cron.d"
+CRON_JOB_NAME = "daily_maintenance"  # cron skips cron.d files containing dots
+
 def create_sample_script():
     """Create a sample script to be scheduled"""
     script_content = '''#!/bin/bash
@@ -36,9 +39,71 @@ echo "---"
         print(f"✅ Created sample script: {script_path}")
         return os.path.abspath(script_path)
 
+def install_cron_d_job(script_path, log_file):
+    """Write the job as an /etc/cron.d drop-in via atomic rename (root only, no crontab subprocess)"""
+    job_path = os.path.join(CRON_D_DIR, CRON_JOB_NAME)
+    job_content = f"0 0 * * * root {script_path} >> {log_file} 2>&1\n"
+    
+    try:
+        with open(job_path, 'r') as f:
+            if f.read() == job_content:
+                print(f"⚠️  Cron job already exists for {script_path}")
+                return
+    except FileNotFoundError:
+        pass
+    
+    # Write to a dotted temp name cron ignores, then rename so cron never sees a partial file
+    tmp_path = os.path.join(CRON_D_DIR, f".{CRON_JOB_NAME}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(job_content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, job_path)
+    except BaseException:
+        # Don't leave the temp file behind in /etc/cron.d
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    print(f"✅ Cron job created successfully: {job_path}")
+    print(f"   Schedule: Daily at midnight (00:00)")
+    print(f"   Script: {script_path}")
+    print(f"   Log file: {log_file}")
+
+def remove_legacy_crontab_entry(script_path):
+    """Drop lines running script_path from the user's crontab (left by older versions of this script)"""
+    try:
+        result = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return  # No crontab command, so no legacy entry either
+    if result.returncode != 0:
+        return
+    
+    lines = result.stdout.splitlines()
+    kept = [line for line in lines if script_path not in line.split()]
+    if len(kept) == len(lines):
+        return
+    
+    new_cron = "".join(line + "\n" for line in kept)
+    process = subprocess.Popen(['crontab', '-'], stdin=subprocess.PIPE, text=True)
+    process.communicate(input=new_cron)
+    if process.returncode == 0:
+        print(f"🧹 Removed legacy crontab entry for {script_path}")
+    else:
+        print(f"⚠️  Could not remove legacy crontab entry for {script_path}; it may run twice")
+
 def setup_cron_job(script_path, log_file="/var/log/daily_maintenance.log"):
     """Set up cron job to run script daily at midnight"""
     
+    if os.geteuid() == 0 and os.path.isdir(CRON_D_DIR):
+        try:
+            install_cron_d_job(script_path, log_file)
+            # The job now lives in cron.d; a copy in root's crontab would run it twice
+            remove_legacy_crontab_entry(script_path)
+        except Exception as e:
+            print(f"❌ Error setting up cron job: {e}")
+        return
+    
     # Cron job entry: minute hour day month weekday command
     cron_entry = f"0 0 * * * {script_path} >> {log_file} 2>&1"
     
@@ -47,12 +112,14 @@ def setup_cron_job(script_path, log_file="/var/log/daily_maintenance.log"):
         result = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
         current_cron = result.stdout if result.returncode == 0 else ""
         
-        # Check if job already exists
-        if script_path in current_cron:
+        # Check if job already exists (whole-line match, not a substring of another path)
+        if cron_entry in current_cron.splitlines():
             print(f"⚠️  Cron job already exists for {script_path}")
             return
         
         # Add new cron job
+        if current_cron and not current_cron.endswith("\n"):
+            current_cron += "\n"
         new_cron = current_cron + cron_entry + "\n"
         
         # Install new crontab
@@ -74,6 +141,12 @@ def setup_cron_job(script_path, log_file="/var/log/daily_maintenance.log"):
 
 def show_cron_jobs():
     """Display current cron jobs"""
+    job_path = os.path.join(CRON_D_DIR, CRON_JOB_NAME)
+    if os.path.exists(job_path):
+        with open(job_path, 'r') as f:
+            print(f"\n📋 {job_path}:")
+            print(f.read())
+    
     try:
         result = subprocess.run(['crontab', '-l'], capture_output=True, text=True)
         if result.returncode == 0 and result.stdout.strip():